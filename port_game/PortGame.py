@@ -5,6 +5,7 @@ import tkinter as tk
 import port_game.Cargo
 from port_game.vehicles import Lorry, Ship
 from port_game.Port import Port
+from port_game.telemetry import TelemetryServer
 
 
 class PortGame:
@@ -20,6 +21,9 @@ class PortGame:
     fail_on_lorry_queue_full = False
     fail_on_no_money = True
 
+    telemetry_port = 8765  # None disables the spectator stream
+    telemetry_rate = 5  # updates per second
+
     def __init__(self, root):
         self.game_running = True
 
@@ -48,6 +52,15 @@ class PortGame:
         self.lorry_delete_queue = []  # collect ids to delete in main loop. avoid changing dict during iteration
         self.ship_delete_queue = []
 
+        self.telemetry = None
+        if self.telemetry_port is not None:
+            self.telemetry = TelemetryServer(port=self.telemetry_port, rate=self.telemetry_rate)
+            try:
+                self.telemetry.start()
+            except OSError as e:
+                print(f"Telemetry disabled: {e}")
+                self.telemetry = None
+
         self.create_lorry()
         self.create_ship()
 
@@ -57,6 +70,8 @@ class PortGame:
         self.canvas.create_text(self.win_w / 2, self.win_h / 2, text=f"Game over: {message}", fill="red",
                                 font=("mono", 28))
         self.game_running = False
+        if self.telemetry:
+            self.telemetry.maybe_publish(self, force=True)
 
     def create_lorry(self):
         if not self.game_running:
@@ -125,6 +140,8 @@ class PortGame:
             self.game_over("You are broke")
         self.canvas.itemconfig(self.money_text, text=f"{round(self.money)} $")
         self.canvas.itemconfig(self.time_text, text=f"{round(self.elapsed_time)} s")
+        if self.telemetry:
+            self.telemetry.maybe_publish(self)
 
         self.root.after(50, self.update_game)
 
@@ -0,0 +1,221 @@
+import asyncio
+import collections
+import json
+import sys
+import threading
+import time
+
+
+def _rounded(bounds):
+    return [round(i, 1) for i in bounds]
+
+
+def snapshot(port_game):
+    # must be called from the Tk thread, it reads the canvas
+    return {
+        "money": round(port_game.money, 1),
+        "elapsed_time": round(port_game.elapsed_time, 1),
+        "game_running": port_game.game_running,
+        "lorry_queue": {str(key): {"box": _rounded(value.box_bounds),
+                                   "ready_to_leave": value.ready_to_leave}
+                        for key, value in port_game.lorry_queue.items()},
+        "ship_queue": {str(key): {"box": _rounded(value.box_bounds),
+                                  "wishlist": value.wishlist,
+                                  "ready_to_leave": value.ready_to_leave}
+                       for key, value in port_game.ship_queue.items()},
+        "cargo": {str(key): {"box": _rounded(value.box_bounds),
+                             "type": value.type,
+                             "owner": value.owner,
+                             "status": value.status,
+                             "parent": [type(value.parent).__name__.lower(), value.parent.id]}
+                  for key, value in port_game.cargo.items()},
+    }
+
+
+def diff_state(old, new):
+    changed = {}
+    removed = {}
+    for key, value in new.items():
+        if isinstance(value, dict):
+            old_section = old.get(key, {})
+            section = {k: v for k, v in value.items() if old_section.get(k) != v}
+            if section:
+                changed[key] = section
+            gone = [k for k in old_section if k not in value]
+            if gone:
+                removed[key] = gone
+        elif old.get(key) != value:
+            changed[key] = value
+    return changed, removed
+
+
+def apply_delta(state, message):
+    if message["kind"] == "full":
+        return message["state"]
+    for key, value in message["state"].items():
+        if isinstance(value, dict):
+            state.setdefault(key, {}).update(value)
+        else:
+            state[key] = value
+    for key, gone in message.get("removed", {}).items():
+        for k in gone:
+            state.get(key, {}).pop(k, None)
+    return state
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+class SpectatorClient:
+    def __init__(self, writer, max_buffer):
+        self.writer = writer
+        self.buffer = collections.deque(maxlen=max_buffer)  # drop-oldest
+        self.wakeup = asyncio.Event()
+        self.resync = True  # first thing a client gets is a full frame
+        self.task = asyncio.current_task()
+
+    def push(self, data):
+        if len(self.buffer) == self.buffer.maxlen:
+            # the dropped delta breaks the chain, send a full frame next time instead
+            self.resync = True
+        self.buffer.append(data)
+        self.wakeup.set()
+
+
+class TelemetryServer:
+    def __init__(self, host="127.0.0.1", port=8765, rate=5, max_buffer=20):
+        self.host = host
+        self.port = port
+        self.interval = 1 / rate
+        self.max_buffer = max_buffer
+        self.clients = set()
+        self.state = {}
+        self.seq = 0
+        self.last_publish = 0
+
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.pending = None  # newest state handed over by the Tk thread, not yet broadcast
+        self.pending_lock = threading.Lock()
+
+    def start(self):
+        ready = threading.Event()
+        error = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.server = self.loop.run_until_complete(
+                    asyncio.start_server(self.handle_client, self.host, self.port))
+            except OSError as e:
+                error.append(e)
+                ready.set()
+                self.loop.close()
+                return
+            ready.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="port_game-telemetry", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if error:
+            raise error[0]
+
+    def stop(self):
+        if self.loop is None or self.loop.is_closed():
+            return
+
+        async def shutdown():
+            self.server.close()
+            tasks = [client.task for client in self.clients]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+            self.loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop)
+        self.thread.join(timeout=1)
+
+    def maybe_publish(self, port_game, force=False):
+        # called on every game tick, throttled to the telemetry rate
+        now = time.time()
+        if not force and now - self.last_publish < self.interval:
+            return
+        self.last_publish = now
+        self.publish(snapshot(port_game))
+
+    def publish(self, state):
+        # never blocks the caller: only the newest state is kept until the loop thread picks it up
+        with self.pending_lock:
+            scheduled = self.pending is not None
+            self.pending = state
+        if not scheduled:
+            self.loop.call_soon_threadsafe(self.broadcast)
+
+    def broadcast(self):
+        with self.pending_lock:
+            state, self.pending = self.pending, None
+        if state is None:
+            return
+        changed, removed = diff_state(self.state, state)
+        self.state = state
+        if not changed and not removed:
+            return
+        self.seq += 1
+        message = {"seq": self.seq, "kind": "delta", "state": changed}
+        if removed:
+            message["removed"] = removed
+        data = encode(message)
+        for client in self.clients:
+            client.push(data)
+
+    async def handle_client(self, reader, writer):
+        client = SpectatorClient(writer, self.max_buffer)
+        self.clients.add(client)
+        client.wakeup.set()
+        try:
+            while True:
+                await client.wakeup.wait()
+                client.wakeup.clear()
+                if client.resync:
+                    client.resync = False
+                    client.buffer.clear()
+                    writer.write(encode({"seq": self.seq, "kind": "full", "state": self.state}))
+                while client.buffer:
+                    writer.write(client.buffer.popleft())
+                # slow consumers wait here, while push() keeps dropping their oldest frames
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+
+async def spectate(host="127.0.0.1", port=8765):
+    # local stand-in client: rebuilds the game state from the stream and prints a summary line
+    reader, writer = await asyncio.open_connection(host, port)
+    state = {}
+    try:
+        while line := await reader.readline():
+            message = json.loads(line)
+            state = apply_delta(state, message)
+            print(f"#{message['seq']:<6} {message['kind']:<5} "
+                  f"{state.get('elapsed_time', 0):>7} s {state.get('money', 0):>8} $ "
+                  f"lorries: {len(state.get('lorry_queue', {}))} "
+                  f"ships: {len(state.get('ship_queue', {}))} "
+                  f"cargo: {len(state.get('cargo', {}))}")
+    finally:
+        writer.close()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    try:
+        asyncio.run(spectate(port=port))
+    except KeyboardInterrupt:
+        pass